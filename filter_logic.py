@@ -1,20 +1,26 @@
+import functools
 import re
+from operator import itemgetter
 from siem_core import Syslog
 
+try:
+    import ahocorasick  # Optional (pyahocorasick): single-pass search for several message() needles
+except ImportError:
+    ahocorasick = None
+
+
 class LogFilter:
     """ Parses and evaluates custom filter strings against Syslog objects. """
 
-    # Map filter keys (lowercase) to Syslog object
-    FIELD_MAP = {
-        "pid": lambda log: str(log.pid or ""),
-        "hostname": lambda log: str(log.hostname or "").lower(),
-        "severity": lambda log: str(log.severity_info[0] or "").lower() if log.severity_info else "",
-        "facility": lambda log: str(log.facility_info[0] or "").lower() if log.facility_info else "",
-        "process": lambda log: str(log.process_name or "").lower(),
-        "message": lambda log: str(log.message or "").lower(),
-        "timestamp": lambda log: str(log.timestamp or ""),
-        "priority": lambda log: str(log.priority or ""),
-    }
+    # Map filter keys (lowercase) to the normalized values precomputed on each Syslog object (Syslog._lc)
+    FIELD_MAP = {field: itemgetter(field) for field in
+                 ("pid", "hostname", "severity", "facility", "process", "message", "timestamp", "priority")}
+    EMPTY_FIELDS = dict.fromkeys(FIELD_MAP, "")  # Used for objects without precomputed fields
+
+    # Relative evaluation cost, used to run cheap conditions first within an AND group
+    FIELD_COST = {"pid": 0, "priority": 0, "severity": 1, "facility": 1,
+                  "hostname": 2, "process": 2, "timestamp": 2, "message": 3}
+    OPERATOR_COST = {"=": 0, "==": 0, "!=": 0, "contains": 2}
 
     # Regex to parse a single condition : field=value, field="value", message("value")
     # Allows operators... Handles numbers and quoted strings... Handles message() function.
@@ -26,46 +32,56 @@ class LogFilter:
         r"|" # OR
         r"\(\s*(\d+|'[^\']*'|\"[^\"]*\")\s*\)" # 4: Value for function style like message("...")
         r")\s*" # End group
-        , re.IGNORECASE
-    )
+    ) # No re.IGNORECASE: conditions are lowercased before matching
 
     def __init__(self, filter_string=""):
         self.filter_string = filter_string.strip()
         self.parsed_filter = None
+        self.message_automaton = None # Aho-Corasick automaton over message() needles, if used
+        self.required_literal = None # message() needle every OR group needs, checked before anything else
         self.error = None
         if self.filter_string:
             try:
-                self.parsed_filter = self._parse()
+                self.parsed_filter, self.message_automaton, self.required_literal = _compile_filter(self.filter_string)
             except ValueError as e:
                 self.error = str(e)
                 self.parsed_filter = None
 
-    def _parse(self):
+    @classmethod
+    def _parse(cls, filter_string):
         """ Parses the filter string into a structure for evaluation.
-            Structure: List of OR groups, where each group is a List of AND conditions.
-            Example: 'PID=1 && Host="A" || Sev="err"' -> [[(pid,=,1), (host,=,A)], [(sev,=,err)]]
+            Structure: Tuple of OR groups, where each group is a Tuple of AND conditions.
+            Example: 'PID=1 && Host="A" || Sev="err"' -> (((pid,=,1), (host,=,A)), ((sev,=,err),))
+            Each condition is compiled to a callable fn(fields, hits) -> bool (see _compile_condition).
+            The result is immutable so it can be shared through the _compile_filter cache.
+
+            Returns (or_groups, message_automaton, required_literal). The automaton is only built when
+            pyahocorasick is installed and there are 2+ message() needles, otherwise it is None.
+            required_literal is the longest message() needle found in every OR group (None if there
+            is none): a log whose message lacks it can't match, so it is rejected with one 'in' check.
         """
-        if not self.filter_string:
-            return [] # Empty filter matches everything
+        if not filter_string:
+            return (), None, None # Empty filter matches everything
 
         or_groups = []
-        for or_part in self.filter_string.split('||'):
+        for or_part in filter_string.split('||'):
             and_conditions = []
             for and_part in or_part.split('&&'):
                 and_part = and_part.strip()
                 if not and_part:
                     continue # Skip empty parts
 
-                match = self.CONDITION_REGEX.fullmatch(and_part)
+                # Field names and values are case-insensitive, lowercase the whole condition once
+                match = cls.CONDITION_REGEX.fullmatch(and_part.lower())
                 if not match:
                     raise ValueError(f"Invalid condition syntax: '{and_part}'")
 
-                field = match.group(1).lower()
+                field = match.group(1)
                 operator = match.group(2) # =, ==, !=
                 value = match.group(3)    # Number or quoted string for =/!=
                 func_value = match.group(4) # Value for function style message("...")
 
-                if field not in self.FIELD_MAP:
+                if field not in cls.FIELD_MAP:
                     raise ValueError(f"Unknown filter field: '{field}'")
 
                 if func_value is not None:
@@ -81,19 +97,61 @@ class LogFilter:
                         value = value[1:-1]
                     elif value.startswith('"') and value.endswith('"'):
                         value = value[1:-1]
-                    if field not in ["pid", "priority"] or operator == "contains":
-                         value = value.lower()
 
-                condition = (field, operator, value)
-                and_conditions.append(condition)
+                and_conditions.append((field, operator, value))
 
             if and_conditions:
+                # AND is commutative: evaluate cheapest conditions first so they short-circuit
+                and_conditions.sort(key=lambda c: (cls.OPERATOR_COST[c[1]], cls.FIELD_COST[c[0]]))
                 or_groups.append(and_conditions)
 
-        if not or_groups and self.filter_string:
+        if not or_groups:
              raise ValueError("Filter string provided but no valid conditions found.")
 
-        return or_groups
+        # Several message needles: find all of them with one scan per log instead of one scan each
+        needles = {value for and_conditions in or_groups for field, operator, value in and_conditions
+                   if field == "message" and operator == "contains" and value}
+        automaton = None
+        if ahocorasick is not None and len(needles) >= 2:
+            automaton = ahocorasick.Automaton()
+            for needle in needles:
+                automaton.add_word(needle, needle)
+            automaton.make_automaton()
+
+        # Needles required by every OR group, the longest one is the most selective prefilter
+        required = set.intersection(*({value for field, operator, value in and_conditions
+                                       if field == "message" and operator == "contains" and value}
+                                      for and_conditions in or_groups))
+        required_literal = max(required, key=len) if required else None
+
+        compiled = tuple(tuple(cls._compile_condition(*c, use_hits=automaton is not None) for c in and_conditions)
+                         for and_conditions in or_groups)
+        return compiled, automaton, required_literal
+
+    @classmethod
+    def _compile_condition(cls, field, operator, value, use_hits=False):
+        """ Binds the field getter and filter value into a single predicate closure.
+            Done once at parse time so matches() does no dict lookups or operator dispatch.
+            Closures take (fields, hits): fields are the normalized values in syslog_obj._lc
+            (no per-call str()/lower()), hits the needles found by the message automaton.
+        """
+        getter = cls.FIELD_MAP[field]
+        value = str(value)
+
+        if operator == "contains":
+            if use_hits and field == "message" and value:
+                def condition(fields, hits):
+                    return value in hits
+            else:
+                def condition(fields, hits):
+                    return value in getter(fields)
+        elif operator == "!=":
+            def condition(fields, hits):
+                return getter(fields) != value
+        else:  # = and ==
+            def condition(fields, hits):
+                return getter(fields) == value
+        return condition
 
     def matches(self, syslog_obj: Syslog) -> bool:
         """ Checks if a Syslog object matches the parsed filter. """
@@ -102,37 +160,22 @@ class LogFilter:
         if not self.parsed_filter:
             return True # Empty or cleared filter matches everything
 
-        # Check OR groups
-        for and_group in self.parsed_filter:
-            all_and_conditions_met = True
-            # Check AND conditions within the group
-            for field, operator, filter_value in and_group:
-                if field not in self.FIELD_MAP:
-                     all_and_conditions_met = False
-                     break
-
-                # Get the actual value from the syslog object using the mapping
-                try:
-                    actual_value = self.FIELD_MAP[field](syslog_obj)
-                except Exception:
-                    actual_value = ""
-
-                # Perform comparison
-                match_found = False
-                if operator == "contains":
-                    match_found = filter_value in actual_value
-                elif operator == "=" or operator == "==":
-                    match_found = actual_value == str(filter_value)
-                elif operator == "!=":
-                    match_found = actual_value != str(filter_value)
-
-                if not match_found:
-                    all_and_conditions_met = False
-                    break
-
-            # If all AND conditions in this OR group were met, the whole filter matches
-            if all_and_conditions_met:
-                return True
-
-        # If no OR group matched... filter fails
-        return False
\ No newline at end of file
+        fields = getattr(syslog_obj, "_lc", self.EMPTY_FIELDS)
+        if self.required_literal is not None and self.required_literal not in fields["message"]:
+            return False
+        hits = None
+        if self.message_automaton is not None:
+            hits = {needle for _, needle in self.message_automaton.iter(fields["message"])}
+
+        # Any OR group matches if all of its AND conditions match
+        return any(all(condition(fields, hits) for condition in and_group)
+                   for and_group in self.parsed_filter)
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_filter(filter_string):
+    """ Cached LogFilter._parse, so re-applying a recently used filter string skips parsing.
+        Returns (or_groups, message_automaton, required_literal).
+        Invalid filters raise ValueError and are not cached.
+    """
+    return LogFilter._parse(filter_string)
@@ -0,0 +1,183 @@
+"""
+Log Model - Table model behind the GUI log display
+
+Handles:
+1. Storing received Syslog objects for the log table (Qt model/view, no per-cell widgets)
+2. Supplying display text and tooltips only for the cells Qt actually paints
+3. Appending logs in batches (one row insert notification per batch), oldest rows dropped past a cap
+4. Hiding rows that don't pass the monitoring level / text filter (proxy model)
+
+Major Classes:
+- SyslogTableModel: QAbstractTableModel over a list of Syslog objects
+- LogFilterProxy: QSortFilterProxyModel applying the GUI's level and text filters
+"""
+
+from operator import attrgetter
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+from filter_logic import LogFilter
+
+# Column layout of the log table
+COLUMN_HEADERS = ("Timestamp", "Hostname", "Severity", "Facility", "Process", "PID", "Message")
+MESSAGE_COLUMN = 6
+
+# Per-column Syslog attribute getters and the text shown when the value is empty
+COLUMN_GETTERS = tuple(attrgetter(name) for name in (
+    "timestamp", "hostname", "severity_label", "facility_label", "process_name", "pid", "message"))
+COLUMN_DEFAULTS = ("N/A", "N/A", "N/A", "N/A", "", "", "N/A")
+
+MAX_DISPLAY_ROWS = 50_000  # Oldest logs are dropped from the table past this (saved log files are unaffected)
+
+
+class SyslogTableModel(QAbstractTableModel):
+    """
+    Read-only table model holding the Syslog objects shown in the GUI.
+
+    - Rows are Syslog objects, cell text is looked up on demand in data()
+    - Unparsed logs show their to_string() text in the message column only
+    - Qt.UserRole returns the row's Syslog object
+    - Holds at most max_rows logs, the oldest are removed as new ones arrive
+    """
+
+    def __init__(self, parent=None, max_rows=MAX_DISPLAY_ROWS):
+        """
+        Args:
+            parent: PyQt parent object
+            max_rows (int): Maximum number of logs held
+        """
+        super().__init__(parent)
+        self._rows = []  # List, not deque: the filter proxy indexes every row and deque indexing is O(n)
+        self._max_rows = max_rows
+
+    def rowCount(self, parent=QModelIndex()):
+        """Number of logs held (0 for child indexes, this is a flat table)."""
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        """Number of table columns."""
+        return 0 if parent.isValid() else len(COLUMN_HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        """
+        Return cell data for the view.
+
+        Args:
+            index (QModelIndex): Cell being queried
+            role (int): Qt item data role
+
+        Returns:
+            Display text, message tooltip, the Syslog object (Qt.UserRole), or None
+        """
+        if not index.isValid():
+            return None
+        syslog_obj = self._rows[index.row()]
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            if not syslog_obj.parsed:
+                return syslog_obj.to_string() if column == MESSAGE_COLUMN else ""
+            return COLUMN_GETTERS[column](syslog_obj) or COLUMN_DEFAULTS[column]
+        if role == Qt.ToolTipRole:
+            if column == MESSAGE_COLUMN and syslog_obj.parsed:
+                return syslog_obj.message or None
+            return None
+        if role == Qt.UserRole:
+            return syslog_obj
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Column titles for the horizontal header, default numbering otherwise."""
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return COLUMN_HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def syslog_at(self, row):
+        """
+        Args:
+            row (int): Model row
+
+        Returns:
+            Syslog: Log shown in that row
+        """
+        return self._rows[row]
+
+    def append_logs(self, syslog_objs):
+        """
+        Add logs to the end of the table with a single row-insert notification.
+        Drops the oldest rows first (one row-remove notification) if the cap would be exceeded.
+
+        Args:
+            syslog_objs (list): Syslog objects to append
+        """
+        if not syslog_objs:
+            return
+        if len(syslog_objs) > self._max_rows:
+            syslog_objs = syslog_objs[-self._max_rows:]
+
+        overflow = len(self._rows) + len(syslog_objs) - self._max_rows
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            del self._rows[:overflow]  # One memmove per batch
+            self.endRemoveRows()
+
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(syslog_objs) - 1)
+        self._rows.extend(syslog_objs)
+        self.endInsertRows()
+
+    def clear(self):
+        """Remove all logs."""
+        self.beginResetModel()
+        self._rows.clear()
+        self.endResetModel()
+
+
+class LogFilterProxy(QSortFilterProxyModel):
+    """
+    Shows only the rows of a SyslogTableModel that pass the current filters.
+
+    - Monitoring level: hides logs above the selected level (-1 = all levels)
+    - Text filter: LogFilter.matches() on the row's Syslog object
+    - Unparsed logs only show while no filter is active
+    - New rows are checked as they are inserted, set_filter() re-checks all rows
+    """
+
+    def __init__(self, parent=None):
+        """
+        Args:
+            parent: PyQt parent object
+        """
+        super().__init__(parent)
+        self._monitor_level = -1
+        self._log_filter = LogFilter()
+        self._accept_all = True  # No level or text filter active
+
+    def set_filter(self, monitor_level, log_filter):
+        """
+        Replace the active filters and re-filter every row (no-op if both are unchanged).
+
+        Args:
+            monitor_level (int): Highest monitoring level to show (0-3), -1 shows all
+            log_filter (LogFilter): Parsed text filter
+        """
+        if monitor_level == self._monitor_level and log_filter is self._log_filter:
+            return
+        self._monitor_level = monitor_level
+        self._log_filter = log_filter
+        self._accept_all = monitor_level == -1 and not log_filter.filter_string
+        # Full invalidate: one layout change, invalidateFilter() notifies each changed row range separately
+        self.invalidate()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        """Level and text filter check for one source row."""
+        if self._accept_all:
+            return True  # Also shows unparsed logs
+        syslog_obj = self.sourceModel().syslog_at(source_row)
+        level = self._monitor_level
+
+        # Unparsed logs (error messages) only show when no filters are active
+        if not syslog_obj.parsed:
+            return False
+
+        if level != -1 and (syslog_obj.log_monitor_level is None or syslog_obj.log_monitor_level > level):
+            return False
+        return self._log_filter.matches(syslog_obj)
@@ -0,0 +1,210 @@
+"""
+Log Writer - Saves received logs to daily JSON files (Backend Logic)
+
+Handles:
+1. Writing Syslog objects to syslog_YYYY-MM-DD.json.log in the log directory, one JSON object per line
+2. Keeping the day's file open and buffered, reopening it at local midnight or on a directory change
+3. Running in its own thread so slow disks never block the GUI
+4. Bounding the queue of unwritten entries (oldest are dropped if the disk can't keep up)
+
+Major Classes:
+- LogWriter: Queue + writer loop that runs in a background thread
+"""
+
+import collections
+import json
+import logging
+import os
+import threading
+import time
+from PyQt5.QtCore import QObject, pyqtSignal
+
+try:
+    import orjson  # Optional: much faster JSON encoding for file logging
+except ImportError:
+    orjson = None
+
+log = logging.getLogger("siem.writer")
+
+# === Configuration ===
+LOG_FILE_BUFFER_SIZE = 64 * 1024  # Write buffer for the open daily log file
+LOG_FLUSH_INTERVAL = 1.0  # Seconds between pushing buffered log lines to disk
+WRITER_MAX_PENDING = 100_000  # Unwritten entries held before the oldest are dropped
+
+
+def _json_line(log_dict):
+    """Serialize one log entry as a newline-terminated UTF-8 JSON line."""
+    if orjson:
+        return orjson.dumps(log_dict) + b"\n"
+    # Same bytes as orjson: no spaces after separators, non-ASCII written as UTF-8
+    return json.dumps(log_dict, separators=(",", ":"), ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+class LogWriter(QObject):
+    """
+    Appends log entries to the daily JSON log file, in its own thread.
+
+    - submit() only queues (deque appends/pops are thread-safe), the thread does to_dict(), JSON and file I/O
+    - Each pass writes everything queued with one writelines() call
+    - Directory changes and close requests are applied by the thread between writes
+    """
+
+    # === PyQt Signals ===
+    write_error = pyqtSignal(str)  # Error text for the GUI status bar
+
+    def __init__(self, log_directory, parent=None):
+        """
+        Args:
+            log_directory (str): Directory the daily files are written to
+            parent: PyQt parent object
+        """
+        super().__init__(parent)
+        self._running = False
+        self._queue = collections.deque()  # Syslog objects waiting to be written
+        self._wake = threading.Event()  # Set when entries are queued, a request is made or stop() is called
+        self._dropped = 0  # Entries dropped since the last report
+        self._dropped_lock = threading.Lock()  # _dropped is updated by submit() and reset by the writer thread
+
+        # === Requests from the GUI thread, applied by the writer thread ===
+        self._log_directory = log_directory
+        self._close_requested = False
+
+        # === Open daily file (writer thread only) ===
+        self._file = None
+        self._file_path = None
+        self._file_directory = None
+        self._day_end = 0.0  # Local midnight ending the open file's day
+
+    def submit(self, entries):
+        """
+        Queue logs for writing. Called from the GUI thread.
+
+        Args:
+            entries (list): Syslog objects
+        """
+        queue = self._queue
+        dropped = 0
+        if len(entries) > WRITER_MAX_PENDING:
+            dropped = len(entries) - WRITER_MAX_PENDING
+            entries = entries[-WRITER_MAX_PENDING:]
+        overflow = len(queue) + len(entries) - WRITER_MAX_PENDING
+        if overflow > 0:
+            # Disk can't keep up -> drop the oldest unwritten entries
+            try:
+                for _ in range(overflow):
+                    queue.popleft()
+                    dropped += 1
+            except IndexError:
+                pass  # Writer drained the queue meanwhile
+        if dropped:
+            with self._dropped_lock:
+                self._dropped += dropped
+        queue.extend(entries)
+        self._wake.set()
+
+    def set_log_directory(self, log_directory):
+        """Write to a new directory, the open file is closed before the next write."""
+        self._log_directory = log_directory
+        self._wake.set()
+
+    def close_file(self):
+        """Close the open file once everything queued so far is written (logging disabled)."""
+        self._close_requested = True
+        self._wake.set()
+
+    def run(self):
+        """
+        Main writer loop - runs in a separate thread.
+
+        - Waits for queued entries, flushing the file buffer when idle for LOG_FLUSH_INTERVAL
+        - Writes everything queued, then applies close requests
+        """
+        self._running = True
+        last_flush = time.monotonic()
+        while self._running:
+            if not self._wake.wait(LOG_FLUSH_INTERVAL):
+                self._flush_file()
+                last_flush = time.monotonic()
+                continue
+            self._wake.clear()  # Before draining, so a submit() during the drain wakes us again
+
+            self._write_pending()
+            if self._close_requested:
+                self._close_requested = False
+                self._close_file()
+            elif time.monotonic() - last_flush >= LOG_FLUSH_INTERVAL:
+                self._flush_file()
+                last_flush = time.monotonic()
+
+        self._write_pending()
+        self._close_file()
+        log.info("Writer: Run method finished.")
+
+    def _write_pending(self):
+        """Write all queued entries to the daily file."""
+        queue = self._queue
+        entries = []
+        try:
+            for _ in range(len(queue)):
+                entries.append(queue.popleft())
+        except IndexError:
+            pass  # submit() dropped some of them meanwhile
+
+        with self._dropped_lock:
+            dropped, self._dropped = self._dropped, 0
+        if dropped:
+            log.warning("Writer: dropped %d log entries (disk too slow)", dropped)
+            self.write_error.emit(f"Log writer fell behind, dropped {dropped} entries")
+        if not entries:
+            return
+
+        try:
+            # (Re)open the file only when the day ended or the log directory changed
+            if (self._file is None or self._file_directory != self._log_directory
+                    or time.time() >= self._day_end):
+                self._open_file()
+            self._file.writelines(_json_line(syslog_obj.to_dict()) for syslog_obj in entries)
+        except (IOError, OSError) as e:
+            log.error("Error writing to log file %s: %s", self._file_path, e)
+            self.write_error.emit(f"Log Write Error: {e}")
+        except Exception as e:
+            log.exception("Unexpected error during log writing: %s", e)
+            self.write_error.emit(f"Log Write Error: {e}")
+
+    def _open_file(self):
+        """Close the current file and open today's file in the log directory."""
+        self._close_file()
+        directory = self._log_directory
+        now = time.localtime()
+        file_path = os.path.join(directory, f"syslog_{time.strftime('%Y-%m-%d', now)}.json.log")
+        os.makedirs(directory, exist_ok=True)
+        self._file = open(file_path, 'ab', buffering=LOG_FILE_BUFFER_SIZE)
+        self._file_path = file_path
+        self._file_directory = directory
+        # mktime normalizes day+1 past the end of the month
+        self._day_end = time.mktime((now.tm_year, now.tm_mon, now.tm_mday + 1, 0, 0, 0, 0, 0, -1))
+
+    def _flush_file(self):
+        """Push buffered log lines to disk."""
+        if self._file:
+            try:
+                self._file.flush()
+            except (IOError, OSError) as e:
+                log.error("Error flushing log file %s: %s", self._file_path, e)
+                self.write_error.emit(f"Log Write Error: {e}")
+
+    def _close_file(self):
+        """Flush and close the open daily file, if any."""
+        if self._file:
+            try:
+                self._file.close()
+            except (IOError, OSError) as e:
+                log.error("Error closing log file %s: %s", self._file_path, e)
+        self._file = None
+        self._file_path = None
+        self._file_directory = None
+
+    def stop(self):
+        """Request the writer to stop, it writes what is still queued and closes the file first."""
+        self._running = False
+        self._wake.set()
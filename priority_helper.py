@@ -1,84 +1,60 @@
 #priority_helper.py
+
+# Indexed directly by facility value (0-23)
+FACILITY_TABLE = (
+    ("kern", "kernel messages"),
+    ("user", "user-level messages"),
+    ("mail", "mail system"),
+    ("daemon", "system daemons"),
+    ("auth", "security/authorization messages"),
+    ("syslog", "messages generated internally by syslogd"),
+    ("lpr", "line printer subsystem"),
+    ("news", "network news subsystem"),
+    ("uucp", "UUCP subsystem"),
+    ("cron", "clock daemon"),
+    ("authpriv", "security/authorization messages (private)"),
+    ("ftp", "FTP daemon"),
+    ("ntp", "NTP subsystem"),
+    ("security", "log audit"),
+    ("console", "log alert"),
+    ("solaris-cron", "scheduling daemon"),
+    ("local0", "local use 0"),
+    ("local1", "local use 1"),
+    ("local2", "local use 2"),
+    ("local3", "local use 3"),
+    ("local4", "local use 4"),
+    ("local5", "local use 5"),
+    ("local6", "local use 6"),
+    ("local7", "local use 7"),
+)
+
+# Indexed directly by severity value (0-7)
+SEVERITY_TABLE = (
+    ("emergency", "system is unusable"),
+    ("alert", "action must be taken immediately"),
+    ("critical", "critical conditions"),
+    ("error", "error conditions"),
+    ("warning", "warning conditions"),
+    ("notice", "normal but significant condition"),
+    ("informational", "informational messages"),
+    ("debug", "debug-level messages"),
+)
+
 def convert_facility(fac_val):
-    match fac_val:
-        case 0:
-            return ("kern", "kernel messages")
-        case 1:
-            return ("user", "user-level messages")
-        case 2:
-            return ("mail", "mail system")
-        case 3:
-            return ("daemon", "system daemons")
-        case 4:
-            return ("auth", "security/authorization messages")
-        case 5:
-            return ("syslog", "messages generated internally by syslogd")
-        case 6:
-            return ("lpr", "line printer subsystem")
-        case 7:
-            return ("news", "network news subsystem")
-        case 8:
-            return ("uucp", "UUCP subsystem")
-        case 9:
-            return ("cron", "clock daemon")
-        case 10:
-            return ("authpriv", "security/authorization messages (private)")
-        case 11:
-            return ("ftp", "FTP daemon")
-        case 12:
-            return ("ntp", "NTP subsystem")
-        case 13:
-            return ("security", "log audit")
-        case 14:
-            return ("console", "log alert")
-        case 15:
-            return ("solaris-cron", "scheduling daemon")
-        case 16:
-            return ("local0", "local use 0")
-        case 17:
-            return ("local1", "local use 1")
-        case 18:
-            return ("local2", "local use 2")
-        case 19:
-            return ("local3", "local use 3")
-        case 20:
-            return ("local4", "local use 4")
-        case 21:
-            return ("local5", "local use 5")
-        case 22:
-            return ("local6", "local use 6")
-        case 23:
-            return ("local7", "local use 7")
-        case _:
-            return ("unknown", f"unknown facility value:{fac_val}")
+    if 0 <= fac_val < len(FACILITY_TABLE):
+        return FACILITY_TABLE[fac_val]
+    return ("unknown", f"unknown facility value:{fac_val}")
 
 def convert_severity(sev_val):
-    match sev_val:
-        case 0:
-            return ("emergency", "system is unusable")
-        case 1:
-            return ("alert", "action must be taken immediately")
-        case 2:
-            return ("critical", "critical conditions")
-        case 3:
-            return ("error", "error conditions")
-        case 4:
-            return ("warning", "warning conditions")
-        case 5:
-            return ("notice", "normal but significant condition")
-        case 6:
-            return ("informational", "informational messages")
-        case 7:
-            return ("debug", "debug-level messages")
-        case _:
-            return ("unknown", f"unknown severity value:{sev_val}")
+    if 0 <= sev_val < len(SEVERITY_TABLE):
+        return SEVERITY_TABLE[sev_val]
+    return ("unknown", f"unknown severity value:{sev_val}")
 
-def categorize_priority_value(priority_value):
-    facility_value = priority_value // 8
-    severity_value = priority_value % 8
+# Facility info for every facility a 0-255 priority can encode (0-31, 24+ are unknown)
+FACILITY_INFO_LUT = tuple(convert_facility(f) for f in range(32))
 
-    severity_name, _ = convert_severity(severity_value)
-    facility_name, _ = convert_facility(facility_value)
+def _compute_monitor_level(priority_value):
+    severity_name, _ = convert_severity(priority_value % 8)
 
     if severity_name in ["emergency", "alert", "critical"]:
         return 0
@@ -87,4 +63,13 @@ def categorize_priority_value(priority_value):
     elif severity_name in ["warning", "notice"]:
         return 2
     else:
-        return 3
\ No newline at end of file
+        return 3
+
+# Monitoring level for every priority a <PRI> field can hold (0-255), built once at import
+# Callers on the hot path index it directly: MONITOR_LEVEL_LUT[priority]
+MONITOR_LEVEL_LUT = bytes(_compute_monitor_level(p) for p in range(256))
+
+def categorize_priority_value(priority_value):
+    if 0 <= priority_value < 256:
+        return MONITOR_LEVEL_LUT[priority_value]
+    return _compute_monitor_level(priority_value)
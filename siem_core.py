@@ -5,25 +5,65 @@ Handles:
 1. Listening for syslog messages on UDP port 5140
 2. Parsing syslog messages according to RFC 3164 format
 3. Converting raw syslog data into Syslog objects
-4. Running in a separate thread to avoid blocking the GUI thread
+4. Running in separate threads (receive, parse) to avoid blocking the GUI thread
+
+Kernel tuning (Linux, recommended for high-rate UDP):
+- net.core.rmem_max=16777216        (lets SO_RCVBUF actually reach RECV_SOCKET_BUFFER)
+- net.core.netdev_max_backlog=5000  (more packets queued per NIC before dropping)
+  Set with `sysctl -w <key>=<value>` or persist in /etc/sysctl.conf.
 
 Major Classes:
 - Syslog: Represents and parses a single syslog message
-- SysLogListener: UDP socket listener that runs in background thread
+- BatchReceiver: Pulls many UDP datagrams per syscall via Linux recvmmsg()
+- SyslogParser: Turns queued raw datagrams into Syslog objects in its own thread
+- SysLogListener: UDP socket listener that runs in background thread, hands datagrams to the parser
 """
 
+import collections
+import ctypes
+import ctypes.util
+import errno
 import json
+import logging
 import os
+import selectors
 import socket
 import re
+import sys
+import threading
 import time
 from PyQt5.QtCore import QObject, pyqtSignal
-from priority_helper import convert_facility, convert_severity, categorize_priority_value
+from priority_helper import (convert_facility, convert_severity, categorize_priority_value,
+                             FACILITY_INFO_LUT, SEVERITY_TABLE, MONITOR_LEVEL_LUT)
+
+try:
+    from syslog_parse import parse_rfc3164  # Optional compiled parser (cythonize -i syslog_parse.pyx)
+except ImportError:
+    parse_rfc3164 = None
+if os.environ.get("SLOW_PARSE") == "1":
+    parse_rfc3164 = None  # Safety net: force the regex parser even if the compiled one is built
+
+# Diagnostics go through logging, per-packet details (raw data, parse failures) only at DEBUG level
+log = logging.getLogger("siem.listener")
 
 # CONSTANTS
 HOST = '0.0.0.0'  # Listen on all network interfaces
 PORT = 5140  # UDP port to listen for syslog data packets
 DEFAULT_LOGS_DIRECTORY = "syslog_data"  # Dir to save log files
+RECV_BUFFER_SIZE = 2048 * 2  # Bytes per datagram (4096 handles most syslog messages)
+RECV_BATCH_SIZE = 64  # Max datagrams pulled from the kernel per recvmmsg() call
+MSG_WAITFORONE = 0x10000  # Linux recvmmsg flag: only wait for the first datagram
+RECV_SOCKET_BUFFER = 16 * 1024 * 1024  # SO_RCVBUF size, absorbs bursts while Python is busy
+# Listener sockets sharing the port via SO_REUSEPORT (kernel hashes senders across them), one per two cores
+MAX_LISTENER_WORKERS = 4  # A single parser thread consumes them all, more listeners only add GIL contention
+LISTENER_WORKERS = min(MAX_LISTENER_WORKERS, max(1, (os.cpu_count() or 2) // 2)) if hasattr(socket, "SO_REUSEPORT") else 1
+PIN_LISTENER_CPUS = False  # Pin each listener worker to its own CPU (Linux only, opt-in)
+BATCH_MAX_LOGS = 256  # Flush parsed logs to the GUI after this many...
+BATCH_MAX_DELAY = 0.05  # ...or after this many seconds, whichever comes first
+ERROR_BACKOFF_MIN = 0.001  # First sleep after a listener error (seconds), doubles on each repeat...
+ERROR_BACKOFF_MAX = 1.0  # ...up to this cap, and resets after the next successful receive
+KEEP_RAW = os.environ.get("SIEM_KEEP_RAW") == "1"  # Keep the decoded raw line for to_dict() (larger log files)
+INTERN_MAX_ENTRIES = 10000  # Max cached hostnames/process names, bounds memory for sender-controlled values
 
 # RFC 3164 Syslog Format: <priority>timestamp hostname process[pid]: message
 # Example: "<34>Oct 31 22:14:15 machine-name su: 'su root' failed for lonvick on /dev/pts/8"
@@ -39,6 +79,69 @@ SYSLOG_PATTERN = re.compile(
     r"(.*)"  # Group 6: Message (everything else)
 )
 
+# Hostname/process name -> (shared string, lowercased string), oldest entries evicted first (parser thread only)
+_HOSTNAME_INTERN = {}
+_PROCESS_INTERN = {}
+
+# (whole second, formatted local time) of the last receive_time, only used by the parser thread
+_receive_time_cache = (0, "")
+# (whole minute, 'YYYY-MM-DD HH:MM:' local time prefix), only rebuilt by strftime() once a minute
+_receive_minute_cache = (-1, "")
+_TWO_DIGITS = tuple(f"{i:02d}" for i in range(60))
+
+def current_receive_time(now=None):
+    """
+    Local time as 'YYYY-MM-DD HH:MM:SS', formatted at most once per second.
+
+    Logs arriving in the same second share one string instead of each calling strftime(),
+    and strftime() itself only runs for the date/hour/minute prefix once a minute
+    (UTC offsets are whole minutes, so the seconds are the same in local time).
+    Called by the parser thread only (Syslog objects are built there), so the caches need no locking.
+
+    Args:
+        now (float): time.time() value to format, None = current time
+
+    Returns:
+        str: Formatted receive time
+    """
+    global _receive_time_cache, _receive_minute_cache
+    now = int(time.time() if now is None else now)
+    cached_second, formatted = _receive_time_cache
+    if cached_second != now:
+        minute, second = divmod(now, 60)
+        cached_minute, prefix = _receive_minute_cache
+        if cached_minute != minute:
+            prefix = time.strftime('%Y-%m-%d %H:%M:', time.localtime(now))
+            _receive_minute_cache = (minute, prefix)
+        formatted = prefix + _TWO_DIGITS[second]
+        _receive_time_cache = (now, formatted)
+    return formatted
+
+def intern_field(table, value):
+    """
+    Return a shared copy of a repeated field value plus its lowercased form.
+
+    Feeds have few unique hosts/processes, so most logs reuse the cached strings
+    instead of each holding (and lowercasing) their own.
+
+    Args:
+        table (dict): _HOSTNAME_INTERN or _PROCESS_INTERN
+        value (str): Field value, may be None
+
+    Returns:
+        tuple: (interned value, lowercased value), (None, "") for None
+    """
+    if value is None:
+        return None, ""
+    entry = table.get(value)
+    if entry is None:
+        if len(table) >= INTERN_MAX_ENTRIES:
+            del table[next(iter(table))]  # FIFO: dicts keep insertion order
+        value = sys.intern(value)  # Same object as any other interned copy (e.g. dict keys elsewhere)
+        entry = table[value] = (value, sys.intern(value.lower()))
+    return entry
+
+
 class Syslog:
     """
     Represents a single syslog message through basic parsing.
@@ -46,19 +149,30 @@ class Syslog:
     - Handles both successful parsing and errors
     - Extracts facility and severity from priority
     - Stores both parsed data and original raw data
+    - Uses __slots__ (no per-instance __dict__), the GUI keeps many of these alive
     """
 
-    def __init__(self, data, addr):
+    __slots__ = (
+        "data_raw", "addr", "source_ip",
+        "priority", "timestamp", "hostname", "process_name", "pid", "message",
+        "facility_info", "severity_info", "facility_label", "severity_label",
+        "log_monitor_level", "receive_time", "parsed", "_lc", "_raw_str",
+    )
+
+    def __init__(self, data, addr, received_at=None):
         """
         Initialize a new Syslog object from raw UDP data.
 
         Args:
             data (bytes): Raw bytes received from the UDP socket
             addr (tuple): (IP address, port) of sender
+            received_at (float): time.time() when the datagram arrived, None = now
         """
         # === Raw Data Storage ===
         self.data_raw = data  # Keep original bytes for debugging
         self.addr = addr  # Source IP and port tuple
+        self.source_ip = addr[0] if addr else "N/A"
+        self._raw_str = None  # Decoded raw line, only kept when KEEP_RAW is set
 
         # === Parsed Syslog Fields ===
         self.priority = None  # Combined facility/severity number
@@ -68,10 +182,6 @@ class Syslog:
         self.pid = None  # Process ID
         self.message = None  # Actual log message
 
-        # === Extracted Priority Components ===
-        self.facility = None  # Facility code (0-23, what type of program)
-        self.severity = None  # Severity level (0-7, how important, lower values being more important)
-
         # === Human-Readable Info (tuples of name + description) ===
         self.facility_info = ("unknown", "not yet parsed")
         self.severity_info = ("unknown", "not yet parsed")
@@ -80,11 +190,29 @@ class Syslog:
         self.log_monitor_level = 3  # Default to lowest
 
         # === System Time Recvd ===
-        self.receive_time = time.strftime('%Y-%m-%d %H:%M:%S')  # Store when we received it
+        self.receive_time = current_receive_time(received_at)  # Store when we received it (cached per second)
 
         # === Parse the raw data ===
         self.parsed = self.parse_data()  # True if parsing succeeded
 
+        # === Names only, precomputed for to_dict()/to_string()/the GUI ===
+        self.facility_label = self.facility_info[0]
+        self.severity_label = self.severity_info[0]
+
+        # === Normalized field values for LogFilter (computed once, not per filter check) ===
+        self._lc = self._filter_fields()
+
+    @property
+    def facility(self):
+        """Facility code (0-23, what type of program), derived from priority. None if unparsed."""
+        # RFC 3164: priority = facility * 8 + severity
+        return None if self.priority is None else self.priority >> 3
+
+    @property
+    def severity(self):
+        """Severity level (0-7, lower is more important), derived from priority. None if unparsed."""
+        return None if self.priority is None else self.priority & 7
+
     def parse_data(self):
         """
         Parse raw syslog data using regex pattern.
@@ -98,30 +226,36 @@ class Syslog:
         try:
             # === Convert bytes to string ===
             log_message = self.data_raw.decode('utf-8', errors='replace')
+            if KEEP_RAW:
+                self._raw_str = log_message or None  # Reuse this decode instead of decoding again in to_dict()
 
-            # === Apply regex pattern ===
-            match = SYSLOG_PATTERN.match(log_message)
-
-            if match:
-                # === Extract matched groups ===
-                self.priority = int(match.group(1))  # <34> becomes 34
-                self.timestamp = match.group(2)  # "Oct 11 22:14:15"
-                self.hostname = match.group(3)  # "mymachine"
-                self.process_name = match.group(4)  # "su"
-                self.pid = match.group(5)  # "1234" or None
-                self.message = match.group(6)  # "'su root' failed..."
-
-                # === Calculate facility and severity from priority ===
-                # RFC 3164: priority = facility * 8 + severity
-                self.facility = int(self.priority // 8)  # Integer division
-                self.severity = int(self.priority % 8)  # Modulo operation
-
-                # === Get human-readable information ===
-                self.facility_info = convert_facility(self.facility)
-                self.severity_info = convert_severity(self.severity)
-
-                # === Determine the monitoring level for GUI filtering ===
-                self.log_monitor_level = categorize_priority_value(self.priority)
+            # === Split into fields: compiled parser if built, else the regex pattern ===
+            if parse_rfc3164 is not None:
+                fields = parse_rfc3164(log_message)
+            else:
+                match = SYSLOG_PATTERN.match(log_message)
+                fields = match.groups() if match else None
+
+            if fields:
+                # === Extract matched groups (same order as the regex groups) ===
+                (priority,  # "34"
+                 self.timestamp,  # "Oct 11 22:14:15"
+                 self.hostname,  # "mymachine"
+                 self.process_name,  # "su"
+                 self.pid,  # "1234" or None
+                 self.message) = fields  # "'su root' failed..."
+                priority = self.priority = int(priority)  # <34> becomes 34
+
+                # === Human-readable info and monitoring level (facility/severity are derived, see properties) ===
+                # Valid priorities (0-255) are plain table lookups, anything larger falls back to the helpers
+                if priority < 256:
+                    self.facility_info = FACILITY_INFO_LUT[priority >> 3]
+                    self.severity_info = SEVERITY_TABLE[priority & 7]
+                    self.log_monitor_level = MONITOR_LEVEL_LUT[priority]
+                else:
+                    self.facility_info = convert_facility(priority >> 3)
+                    self.severity_info = convert_severity(priority & 7)
+                    self.log_monitor_level = categorize_priority_value(priority)
 
                 return True
 
@@ -129,16 +263,40 @@ class Syslog:
                 # === PARSING FAILED: Store message and source IP anyway ===
                 self.message = f"UNPARSEABLE: {log_message[:200]}..."
                 self.hostname = self.addr[0]  # Use source IP as fallback hostname
-                print(f"!!!Failed to parse message from {self.addr}: {log_message[:100]}...")
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("Failed to parse message from %s: %s...", self.addr, log_message[:100])
                 return False
 
         except Exception as e:
             # === EXCEPTION DURING PARSING: Store error info through raw data then ===
-            print(f"Failed to parse message from {self.addr}: {e}")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Failed to parse message from %s: %s", self.addr, e)
             self.message = f"PARSING_ERROR: {e} | Data: {self.data_raw[:100]}..."
             self.hostname = self.addr[0]  # Source IP as fallback
             return False
 
+    def _filter_fields(self):
+        """
+        Build the string values LogFilter compares against, lowercased where matching is case-insensitive.
+
+        Also swaps hostname/process_name for their interned copies (see intern_field).
+
+        Returns:
+            dict: Filter field name -> normalized string
+        """
+        self.hostname, hostname_lc = intern_field(_HOSTNAME_INTERN, self.hostname)
+        self.process_name, process_lc = intern_field(_PROCESS_INTERN, self.process_name)
+        return {
+            "pid": self.pid or "",
+            "hostname": hostname_lc,
+            "severity": self.severity_label.lower(),
+            "facility": self.facility_label.lower(),
+            "process": process_lc,
+            "message": (self.message or "").lower(),
+            "timestamp": self.timestamp or "",
+            "priority": str(self.priority) if self.priority is not None else "",
+        }
+
     def to_dict(self):
         """
         Convert Syslog object to dictionary for JSON serialization.
@@ -148,20 +306,20 @@ class Syslog:
         """
         return {
             "received_at": self.receive_time,
-            "source_ip": self.addr[0] if self.addr else "N/A",
+            "source_ip": self.source_ip,
             "parsed": self.parsed,
             "priority": self.priority,
             "monitor_level": self.log_monitor_level,
             "timestamp": self.timestamp,
             "hostname": self.hostname,
-            "severity": self.severity_info[0] if self.severity_info else "unknown",
-            "facility": self.facility_info[0] if self.facility_info else "unknown",
+            "severity": self.severity_label,
+            "facility": self.facility_label,
             "process": self.process_name,
             "pid": self.pid,
             "message": self.message,
 
-            # Raw data for debugging (makes files larger, comment out if needed)
-            "raw_data": self.data_raw.decode('utf-8', errors='replace') if self.data_raw else None
+            # Raw data for debugging (makes files larger), None unless SIEM_KEEP_RAW=1
+            "raw_data": self._raw_str
         }
 
     def to_string(self):
@@ -173,74 +331,341 @@ class Syslog:
         """
         if not self.parsed and not self.message:
             # Complete parsing failure
-            return f"Unparsable data/msg from [{self.addr[0]}]"
+            return f"Unparsable data/msg from [{self.source_ip}]"
         elif not self.parsed and self.message:
             # Partial parsing - we have error message
-            return f"Unparsable data from [{self.addr[0]}] : {self.message}"
+            return f"Unparsable data from [{self.source_ip}] : {self.message}"
         else:
             # Successful parsing - format nicely
-            sev_name = self.severity_info[0] if self.severity_info else "N/A"
-            return (f"[{self.timestamp or self.receive_time} | {self.hostname or self.addr[0]} | {sev_name}] "
+            return (f"[{self.timestamp or self.receive_time} | {self.hostname or self.source_ip} | {self.severity_label}] "
                     f"{self.process_name or ''}{f'[{self.pid}]' if self.pid else ''}: "
                     f"{self.message or ''}")
 
+# === ctypes mirrors of the Linux structs used by recvmmsg(2) ===
+class _IOVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+class _SockAddrIn(ctypes.Structure):
+    _fields_ = [
+        ("sin_family", ctypes.c_ushort),
+        ("sin_port", ctypes.c_uint16),  # Network byte order
+        ("sin_addr", ctypes.c_uint8 * 4),
+        ("sin_zero", ctypes.c_uint8 * 8),
+    ]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IOVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _MsgHdr), ("msg_len", ctypes.c_uint)]
+
+
+def _load_recvmmsg():
+    """
+    Look up recvmmsg() in libc.
+
+    Returns:
+        The ctypes function, or None on platforms without it (Windows, macOS)
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        recvmmsg = libc.recvmmsg
+    except (OSError, AttributeError):
+        return None
+    recvmmsg.argtypes = [ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint, ctypes.c_int, ctypes.c_void_p]
+    recvmmsg.restype = ctypes.c_int
+    return recvmmsg
+
+
+_recvmmsg = _load_recvmmsg()
+
+
+class BatchReceiver:
+    """
+    Receives up to batch_size UDP datagrams with a single recvmmsg() syscall.
+
+    - Buffers and message headers are allocated once and reused for every call
+    - Only usable on Linux with an IPv4 (AF_INET) socket, check BatchReceiver.available()
+    """
+
+    def __init__(self, sock, batch_size=RECV_BATCH_SIZE, buffer_size=RECV_BUFFER_SIZE):
+        """
+        Args:
+            sock (socket.socket): Bound UDP socket to read from
+            batch_size (int): Max datagrams returned per receive() call
+            buffer_size (int): Max bytes kept per datagram (extra bytes are truncated)
+        """
+        self._fd = sock.fileno()
+        self._batch_size = batch_size
+        self._buffer_size = buffer_size
+
+        # === One contiguous buffer, sliced into batch_size slots ===
+        self._buffer = ctypes.create_string_buffer(batch_size * buffer_size)
+        self._base = ctypes.addressof(self._buffer)
+
+        self._iovecs = (_IOVec * batch_size)()
+        self._addrs = (_SockAddrIn * batch_size)()
+        self._msgs = (_MMsgHdr * batch_size)()
+        for i in range(batch_size):
+            self._iovecs[i].iov_base = self._base + i * buffer_size
+            self._iovecs[i].iov_len = buffer_size
+            hdr = self._msgs[i].msg_hdr
+            hdr.msg_name = ctypes.addressof(self._addrs[i])
+            hdr.msg_namelen = ctypes.sizeof(_SockAddrIn)
+            hdr.msg_iov = ctypes.pointer(self._iovecs[i])
+            hdr.msg_iovlen = 1
+
+    @staticmethod
+    def available():
+        """True if recvmmsg() can be used on this platform."""
+        return _recvmmsg is not None
+
+    def receive(self):
+        """
+        Pull all pending datagrams (up to batch_size) from the socket.
+
+        Returns:
+            list: (data, addr) tuples, same shape as socket.recvfrom() results.
+                  Empty if nothing was pending.
+
+        Raises:
+            OSError: On socket errors other than "would block"/"interrupted"
+        """
+        count = _recvmmsg(self._fd, self._msgs, self._batch_size, MSG_WAITFORONE, None)
+        if count < 0:
+            err = ctypes.get_errno()
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+                return []
+            raise OSError(err, os.strerror(err))
+
+        datagrams = []
+        for i in range(count):
+            msg = self._msgs[i]
+            sock_addr = self._addrs[i]
+            data = ctypes.string_at(self._base + i * self._buffer_size, msg.msg_len)
+            addr = (socket.inet_ntoa(bytes(sock_addr.sin_addr)), socket.ntohs(sock_addr.sin_port))
+            datagrams.append((data, addr))
+            msg.msg_hdr.msg_namelen = ctypes.sizeof(_SockAddrIn)  # Kernel overwrites this, reset for reuse
+        return datagrams
+
+def listener_cpu(worker_id):
+    """
+    CPU a listener worker should be pinned to, spreading workers over the usable CPUs.
+
+    Args:
+        worker_id (int): Index of the listener worker
+
+    Returns:
+        int: CPU number, or None when pinning is disabled or unsupported
+    """
+    if not PIN_LISTENER_CPUS or LISTENER_WORKERS < 2 or not hasattr(os, "sched_getaffinity"):
+        return None  # A single listener is left to the scheduler
+    cpus = sorted(os.sched_getaffinity(0))
+    return cpus[worker_id % len(cpus)] if cpus else None
+
+
+class SyslogParser(QObject):
+    """
+    Parses raw datagrams queued by the listeners into Syslog objects, in its own thread.
+
+    - Listeners only receive and queue, so parsing never delays the next recvmmsg()/recvfrom()
+    - Queue is a deque of (datagrams, received_at) batches, appends/pops are thread-safe
+    - Emits parsed logs to the GUI in lists (batched to cut cross-thread overhead)
+    """
+
+    # === PyQt Signals ===
+    logs_received = pyqtSignal(list)  # Emits lists of Syslog objects to main thread
+
+    def __init__(self, parent=None):
+        """
+        Args:
+            parent: PyQt parent object
+        """
+        super().__init__(parent)
+        self._running = False
+        self._queue = collections.deque()  # (datagrams, received_at) from the listeners
+        self._wake = threading.Event()  # Set when the queue gets data or stop() is called
+
+        # === Parsed logs waiting to be sent to the GUI ===
+        self._batch = []
+        self._last_flush = time.monotonic()
+
+    def submit(self, datagrams, received_at):
+        """
+        Queue received datagrams for parsing. Called from listener threads.
+
+        Args:
+            datagrams (list): (data, addr) tuples
+            received_at (float): time.time() when they were received
+        """
+        self._queue.append((datagrams, received_at))
+        self._wake.set()
+
+    def run(self):
+        """
+        Main parser loop - runs in a separate thread.
+
+        - Waits for queued datagrams (short timeout while a partial batch is pending)
+        - Parses everything queued, emitting every BATCH_MAX_LOGS logs or BATCH_MAX_DELAY seconds
+        - On stop(), still parses everything already queued before returning
+        """
+        self._running = True
+        while self._running:
+            timeout = BATCH_MAX_DELAY if self._batch else 1.0
+            if not self._wake.wait(timeout):
+                # Nothing new -> send pending logs so a partial batch isn't held back
+                self._flush_batch()
+                continue
+            self._wake.clear()  # Before draining, so a submit() during the drain wakes us again
+            self._parse_pending()
+
+        # Parse what the listeners queued before stopping, then send the last partial batch
+        self._parse_pending()
+        self._flush_batch()
+        log.info("Parser: Run method finished.")
+
+    def _parse_pending(self):
+        """Parse everything queued so far, emitting every BATCH_MAX_LOGS logs or BATCH_MAX_DELAY seconds."""
+        queue = self._queue
+        while queue:
+            datagrams, received_at = queue.popleft()
+            try:
+                for data, addr in datagrams:
+                    if data:
+                        # Create Syslog object (parsing happens in constructor)
+                        self._batch.append(Syslog(data, addr, received_at))
+                        # Send to main thread using signal once the batch is full or old enough
+                        if (len(self._batch) >= BATCH_MAX_LOGS
+                                or time.monotonic() - self._last_flush >= BATCH_MAX_DELAY):
+                            self._flush_batch()
+            except Exception as e:
+                log.exception("Parser error: %s", e)
+
+    def _flush_batch(self):
+        """Emit pending Syslog objects to the main thread as one list."""
+        if self._batch:
+            self.logs_received.emit(self._batch)
+            self._batch = []
+        self._last_flush = time.monotonic()
+
+    def stop(self):
+        """Request the parser to stop, called from main thread after the listeners have stopped."""
+        self._running = False
+        self._wake.set()
+
+
 class SysLogListener(QObject):
     """
     UDP socket listener that runs in a separate thread to avoid locking up the GUI.
 
     - Inherits from QObject to use PyQt signals
     - Uses UDP socket
-    - Emits signals for sending data back to GUI thread
+    - Hands received datagrams to a SyslogParser, which emits the parsed logs
+    - Emits status signals back to GUI thread
     """
 
     # === PyQt Signals ===
-    log_received = pyqtSignal(object)  # Emits Syslog objects to main thread
     status_update = pyqtSignal(str)  # Emits status messages for GUI status bar
 
-    def __init__(self, host=HOST, port=PORT, parent=None):
+    def __init__(self, parser, host=HOST, port=PORT, parent=None, worker_id=0, num_workers=1, cpu_affinity=None):
         """
         Initialize the listener with network configuration.
 
         Args:
+            parser (SyslogParser): Receives the datagrams for parsing (shared by all workers)
             host (str): IP address to bind to ('0.0.0.0' = all interfaces)
             port (int): UDP port to listen on (5140 = standard/default)
             parent: PyQt parent object (inherits for signals...)
+            worker_id (int): Index of this listener when several share the port
+            num_workers (int): Total listeners sharing the port (>1 enables SO_REUSEPORT)
+            cpu_affinity (int): CPU to pin the listener thread to (Linux only), None = no pinning
         """
         super().__init__(parent)
         self._host = host
         self._port = port
+        self._worker_id = worker_id
+        self._num_workers = num_workers
+        self._cpu_affinity = cpu_affinity
         self._running = False  # Control flag for the listener loop
         self._sock = None  # UDP socket object
+        self._receiver = None  # BatchReceiver when recvmmsg() is available
+        self._parser = parser
+        self._selector = None  # Waits on the UDP socket and the wake-up socket
+        self._wake_r = None  # Read end of the wake-up socket pair (stop() writes to _wake_w)
+        self._wake_w = None
 
     def run(self):
         """
         Main listener loop - runs in a separate thread.
 
         - Creates UDP socket and binds to specified port
-        - Continuous loop receiving data with timeout
-        - Creates Syslog objects from received data
-        - Uses signals to communicate back to main thread
+        - Continuous loop receiving data in batches (recvmmsg on Linux, recvfrom elsewhere)
+        - Non-blocking socket drained on each wake-up, stop() wakes the loop immediately
+        - Queues received datagrams on the parser
+        - Uses signals to communicate status back to main thread
         """
         self._running = True
         socket_bound = False
+        backoff = ERROR_BACKOFF_MIN  # Sleep after errors, grows while errors repeat
+
+        # === Optionally pin this thread to one CPU (e.g. the one handling the NIC's RX queue) ===
+        if self._cpu_affinity is not None and hasattr(os, "sched_setaffinity"):
+            try:
+                os.sched_setaffinity(0, {self._cpu_affinity})  # 0 = calling thread
+            except OSError as e:
+                log.warning("Listener: Could not pin to CPU %s: %s", self._cpu_affinity, e)
 
         # === Create and bind UDP socket ===
         try:
             self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             # SO_REUSEADDR allows restarting the app without "Address already in use" error
             self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            # Larger kernel receive queue so bursts aren't dropped (capped by net.core.rmem_max)
+            self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECV_SOCKET_BUFFER)
+            # SO_REUSEPORT lets each worker bind its own socket to the same port
+            if self._num_workers > 1 and hasattr(socket, "SO_REUSEPORT"):
+                self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
             self._sock.bind((self._host, self._port))
+            self._sock.setblocking(False)  # Set once, reads stop at "would block" instead of waiting
             socket_bound = True
 
+            if BatchReceiver.available():
+                self._receiver = BatchReceiver(self._sock)
+
+            # === Wait on the socket and a wake-up socket pair (stop() writes a byte to it) ===
+            # socketpair rather than os.pipe: select() on Windows only accepts sockets
+            self._wake_r, self._wake_w = socket.socketpair()
+            self._wake_r.setblocking(False)
+            self._wake_w.setblocking(False)
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self._sock, selectors.EVENT_READ)
+            self._selector.register(self._wake_r, selectors.EVENT_READ)
+
             # Notify main thread
-            self.status_update.emit(f"Listening on UDP | {self._host}:{self._port}")
-            print(f"Listening on UDP | {self._host}:{self._port}")
+            listen_msg = f"Listening on UDP | {self._host}:{self._port}"
+            if self._num_workers > 1:
+                listen_msg += f" (worker {self._worker_id + 1}/{self._num_workers})"
+            self.status_update.emit(listen_msg)
+            log.info(listen_msg)
 
         except Exception as e:
             # Socket binding failed -> notify main thread and exit
             error_msg = f"Failed to bind socket {self._host}:{self._port} : {e}"
             self.status_update.emit(error_msg)
-            print(error_msg)
+            log.error(error_msg)
             self._running = False
 
         # === Main listening loop (only if socket bound successfully) ===
@@ -248,57 +673,115 @@ class SysLogListener(QObject):
             while self._running:
                 # Safety check -> ensure socket still exists
                 if not self._sock:
-                    print("Listener Error: Socket missing.")
+                    log.error("Listener Error: Socket missing.")
                     self._running = False
                     break
 
                 try:
-                    # === Set timeout to allow program termination ===
-                    # 1 second timeout gives time to check running flag
-                    self._sock.settimeout(1.0)
-
-                    try:
-                        # === Receive UDP data ===
-                        # Buffer size: 4096 bytes (2048*2) handles most syslog messages
-                        data, addr = self._sock.recvfrom(2048 * 2)
-
-                    except socket.timeout:
-                        # Normal timeout -> continue loop to check running flag
-                        continue
-
-                    except socket.error as recv_err:
-                        # Socket error -> log but don't crash
-                        print(f"Listener socket error: {recv_err}")
-                        self.status_update.emit(f"Listener socket error: {recv_err}")
-                        time.sleep(1)  # Prevent error loops
+                    # === Wait for data or a stop() wake-up ===
+                    # 1 second timeout is only a fallback for checking the running flag
+                    events = self._selector.select(1.0)
+                    if not events:
+                        continue  # Normal timeout -> continue loop to check running flag
+
+                    socket_ready = False
+                    for key, _ in events:
+                        if key.fileobj is self._wake_r:
+                            self._wake_r.recv(64)  # Clear the wake-up byte(s), loop re-checks running flag
+                        else:
+                            socket_ready = True
+                    if not socket_ready:
                         continue
 
-                    # === Process received data ===
-                    if data:
-                        print(f"Raw data received from {addr}: {data!r}")
-                        # Create Syslog object (parsing happens in constructor)
-                        new_syslog = Syslog(data, addr)
-                        # Send to main thread using signal
-                        self.log_received.emit(new_syslog)
+                    # === Drain the socket: read until it would block ===
+                    while self._running:
+                        try:
+                            # === Receive UDP data ===
+                            datagrams = self._receive_datagrams()
+                            backoff = ERROR_BACKOFF_MIN
+
+                        except socket.error as recv_err:
+                            # Socket error -> log but don't crash
+                            log.error("Listener socket error: %s", recv_err)
+                            self.status_update.emit(f"Listener socket error: {recv_err}")
+                            time.sleep(backoff)  # Prevent error loops without stalling ingest
+                            backoff = min(backoff * 2, ERROR_BACKOFF_MAX)
+                            break
+
+                        if not datagrams:
+                            break  # Socket empty, back to waiting
+                        self._process_datagrams(datagrams)
 
                 except Exception as e:
                     # Unexpected error in listener loop
-                    print(f"Listener loop error: {e}")
+                    log.exception("Listener loop error: %s", e)
                     self.status_update.emit(f"Listener loop error: {e}")
-                    time.sleep(1)  # Prevent inf looping
+                    time.sleep(backoff)  # Prevent inf looping
+                    backoff = min(backoff * 2, ERROR_BACKOFF_MAX)
 
         # === Cleanup when loop exits ===
-        print("Listener: Cleaning up...")
+        log.info("Listener: Cleaning up...")
         if self._sock:
             try:
                 self._sock.close()
-                print("Listener socket closed.")
+                log.info("Listener socket closed.")
                 self.status_update.emit("Listener Stopped")
             except Exception as close_e:
-                print(f"Listener: Error closing socket: {close_e}")
+                log.error("Listener: Error closing socket: %s", close_e)
             finally:
                 self._sock = None  # Ensure socket reference is cleared
-        print("Listener: Run method finished.")
+                self._receiver = None
+        self._close_wakeup()
+        log.info("Listener: Run method finished.")
+
+    def _receive_datagrams(self):
+        """
+        Read every datagram currently available on the socket.
+
+        Returns:
+            list: (data, addr) tuples. Uses one recvmmsg() call for up to
+                  RECV_BATCH_SIZE datagrams, or up to RECV_BATCH_SIZE recvfrom() calls as fallback
+                  (so the parser still gets one batch instead of one submit per datagram).
+        """
+        if self._receiver:
+            return self._receiver.receive()
+
+        datagrams = []
+        recvfrom = self._sock.recvfrom
+        for _ in range(RECV_BATCH_SIZE):
+            try:
+                datagrams.append(recvfrom(RECV_BUFFER_SIZE))
+            except (BlockingIOError, InterruptedError):
+                break  # Nothing more pending on the non-blocking socket
+            except OSError:
+                if datagrams:
+                    break  # Keep what was received, the error shows up again on the next call
+                raise
+        return datagrams
+
+    def _process_datagrams(self, datagrams):
+        """
+        Queue received datagrams on the parser.
+
+        Args:
+            datagrams (list): (data, addr) tuples from _receive_datagrams()
+        """
+        if log.isEnabledFor(logging.DEBUG):  # Checked once per batch, not per datagram
+            for data, addr in datagrams:
+                log.debug("Raw data received from %s (%d bytes): %r", addr, len(data), data)
+
+        self._parser.submit(datagrams, time.time())
+
+    def _close_wakeup(self):
+        """Close the selector and wake-up sockets created in run()."""
+        if self._selector:
+            self._selector.close()
+            self._selector = None
+        wake_r, wake_w = self._wake_r, self._wake_w
+        self._wake_r = self._wake_w = None  # Cleared first so stop() no longer writes to them
+        for wake_sock in (wake_r, wake_w):
+            if wake_sock is not None:
+                wake_sock.close()
 
     def stop(self):
         """
@@ -307,5 +790,12 @@ class SysLogListener(QObject):
         Called from main thread when application closes.
         Sets the flag that causes the listener loop to exit properly.
         """
-        print("Listener stop requested.")
-        self._running = False
\ No newline at end of file
+        log.info("Listener stop requested.")
+        self._running = False
+        # Wake the loop now instead of after the select timeout
+        wake_w = self._wake_w
+        if wake_w is not None:
+            try:
+                wake_w.send(b"\0")
+            except OSError:
+                pass  # Already closed or full, the loop is waking up anyway
\ No newline at end of file
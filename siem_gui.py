@@ -10,31 +10,130 @@ Handles:
 Key Parts:
 - MainWindow: Primary application window with log table and controls
 - Log filtering by severity level and custom text patterns
-- Persistent QSettings storage
+- Persistent QSettings storage (cached in memory, written on close)
 - File-based logging with 24h rotation
 """
 
 import sys
 import socket
-import time
 import os
-import json
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTableWidget, QTableWidgetItem, QStatusBar, QHeaderView,
+    QTableView, QAbstractItemView, QStatusBar, QHeaderView,
     QLineEdit, QPushButton, QAction, QFileDialog, QLabel,
     QComboBox
 )
-from PyQt5.QtCore import pyqtSlot, QThread, Qt, QSettings
+from PyQt5.QtCore import pyqtSlot, QThread, QSettings, QTimer, QCoreApplication
 
-from siem_core import SysLogListener, Syslog, DEFAULT_LOGS_DIRECTORY
+from siem_core import SysLogListener, SyslogParser, Syslog, DEFAULT_LOGS_DIRECTORY, LISTENER_WORKERS, listener_cpu
 from filter_logic import LogFilter
+from log_writer import LogWriter
+from log_model import SyslogTableModel, LogFilterProxy, COLUMN_HEADERS, MESSAGE_COLUMN, MAX_DISPLAY_ROWS
 import theme
 
 # Settings keys for persistent storage
 SETTINGS_LOG_DIR = "logging/logDirectory"
 SETTINGS_LOG_ENABLED = "logging/logEnabled"
 SETTINGS_MONITOR_LEVEL = "filtering/monitorLevel"
+SETTINGS_MAX_ROWS = "logging/maxRows"
+
+LOG_DRAIN_INTERVAL_MS = 75  # Received batches are collected and added to the table/file together this often
+TABLE_COLUMN_WIDTHS = (130, 130, 90, 90, 110, 60)  # Initial widths of the non-message columns (user resizable)
+TABLE_ROW_HEIGHT = 22  # Fixed row height, rows are never measured individually
+FOLLOW_TAIL_MARGIN = 15  # Keep auto-scrolling while the scrollbar is within this many steps of the bottom
+
+# Application diagnostics (listener status/errors), separate from the saved syslog data
+DIAGNOSTIC_LOG_FILE = "siem.log"
+DIAGNOSTIC_LOG_MAX_BYTES = 5 * 1024 * 1024  # Rotate after 5 MB
+DIAGNOSTIC_LOG_BACKUPS = 3
+
+log = logging.getLogger("siem.gui")
+
+
+def setup_diagnostic_logging(level=logging.INFO):
+    """
+    Send the "siem" loggers to the console and a rotating diagnostics file.
+
+    Logging calls only queue the record, a background QueueListener thread does the console/file I/O.
+
+    Args:
+        level (int): Logging level, DEBUG adds per-packet details (slow at high log rates)
+
+    Returns:
+        QueueListener: Started listener thread, stop() it on exit to write the remaining records
+    """
+    formatter = logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(formatter)
+    handlers = [console_handler]
+
+    file_error = None
+    try:
+        file_handler = RotatingFileHandler(DIAGNOSTIC_LOG_FILE, maxBytes=DIAGNOSTIC_LOG_MAX_BYTES,
+                                           backupCount=DIAGNOSTIC_LOG_BACKUPS, encoding="utf-8")
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+    except OSError as e:
+        file_error = e  # e.g. read-only working directory -> console only
+
+    record_queue = queue.SimpleQueue()
+    queue_listener = QueueListener(record_queue, *handlers)
+
+    siem_logger = logging.getLogger("siem")
+    siem_logger.setLevel(level)
+    siem_logger.addHandler(QueueHandler(record_queue))
+    queue_listener.start()
+    if file_error:
+        log.warning("Diagnostics file %s unavailable, logging to console only: %s", DIAGNOSTIC_LOG_FILE, file_error)
+    return queue_listener
+
+
+class CachedSettings:
+    """
+    In-memory cache in front of QSettings.
+
+    - value() reads each key from QSettings once, then from the cache
+    - setValue() only updates the cache, flush() writes the changed keys and syncs
+    """
+
+    def __init__(self, organization, application):
+        """
+        Args:
+            organization (str): QSettings organization name
+            application (str): QSettings application name
+        """
+        self._qsettings = QSettings(organization, application)
+        self._cache = {}
+        self._dirty = set()
+
+    def value(self, key, default=None):
+        """
+        Args:
+            key (str): Settings key
+            default: Returned when the key has never been saved
+
+        Returns:
+            Cached or stored value for the key
+        """
+        if key not in self._cache:
+            self._cache[key] = self._qsettings.value(key, default)
+        return self._cache[key]
+
+    def setValue(self, key, value):
+        """Update a setting in memory, it is written to storage on flush()."""
+        self._cache[key] = value
+        self._dirty.add(key)
+
+    def flush(self):
+        """Write changed settings to QSettings and sync to disk/registry."""
+        for key in self._dirty:
+            self._qsettings.setValue(key, self._cache[key])
+        self._dirty.clear()
+        self._qsettings.sync()
 
 
 class MainWindow(QMainWindow):
@@ -52,8 +151,8 @@ class MainWindow(QMainWindow):
         """Initialize main window and load user settings."""
         super().__init__(parent)
 
-        # Load persistent settings
-        self.settings = QSettings("SJust", "Simple SIEM")
+        # Load persistent settings (cached in memory, written on close)
+        self.settings = CachedSettings("SJust", "Simple SIEM")
 
         # Window configuration
         self.setWindowTitle("Simple SIEM")
@@ -76,16 +175,34 @@ class MainWindow(QMainWindow):
         except ValueError:
             self.current_monitor_level = -1
 
+        # Load table row cap (oldest rows are dropped past it)
+        max_rows_setting = self.settings.value(SETTINGS_MAX_ROWS, MAX_DISPLAY_ROWS)
+        try:
+            self.max_display_rows = max(1, int(max_rows_setting))
+        except ValueError:
+            self.max_display_rows = MAX_DISPLAY_ROWS
+
         # Initialize filter system
         self.current_filter = LogFilter()
 
+        # Logs received from the parser, waiting for the next drain tick
+        self._pending_logs = []
+
         # Build user interface
         self._setup_ui()
 
-        # Start background syslog listener
-        self.listener_thread = None
-        self.listener = None
-        self.setup_listener_thread()
+        # Writer thread saving logs to the daily JSON files
+        self.setup_log_writer_thread()
+
+        # Start the parser thread and background syslog listeners (one thread per worker)
+        self.listener_threads = []
+        self.listeners = []
+        self.setup_listener_threads()
+
+        # Coalesce incoming batches into one table insert and one file write per tick
+        self._drain_timer = QTimer(self)
+        self._drain_timer.timeout.connect(self._drain_pending_logs)
+        self._drain_timer.start(LOG_DRAIN_INTERVAL_MS)
 
         # Apply initial filters
         self.apply_filter(is_initial=True)
@@ -126,6 +243,11 @@ class MainWindow(QMainWindow):
         clear_action.triggered.connect(self.clear_table)
         file_menu.addAction(clear_action)
 
+        # One-off column sizing (columns never auto-resize on insert)
+        fit_columns_action = QAction("Fit Columns", self)
+        fit_columns_action.triggered.connect(self.fit_columns)
+        file_menu.addAction(fit_columns_action)
+
         file_menu.addSeparator()
 
         # Application exit
@@ -176,142 +298,131 @@ class MainWindow(QMainWindow):
         main_layout.addLayout(filter_layout)
 
     def _create_log_table(self, main_layout):
-        """Create and configure the main log display table."""
-        self.log_display = QTableWidget()
-        self.log_display.setReadOnly = True
+        """Create and configure the main log display table (view over a filtered SyslogTableModel)."""
+        self.log_model = SyslogTableModel(self, max_rows=self.max_display_rows)
+        self.log_proxy = LogFilterProxy(self)  # Hides rows that don't pass the level/text filters
+        self.log_proxy.setSourceModel(self.log_model)
+        self.log_display = QTableView()
+        self.log_display.setModel(self.log_proxy)
         self.log_display.setAlternatingRowColors(True)
-        self.log_display.setSelectionBehavior(QTableWidget.SelectRows)
-        self.log_display.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.log_display.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.log_display.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.log_display.setSortingEnabled(False)
 
         # Configure table columns
-        self.column_headers = ["Timestamp", "Hostname", "Severity", "Facility", "Process", "PID", "Message"]
-        self.log_display.setColumnCount(len(self.column_headers))
-        self.log_display.setHorizontalHeaderLabels(self.column_headers)
+        self.column_headers = list(COLUMN_HEADERS)
 
-        # Set column resize behavior
+        # Fixed/interactive sizes: ResizeToContents would re-measure every row on each insert
         header = self.log_display.horizontalHeader()
-        header.setSectionResizeMode(6, QHeaderView.Stretch)  # Message column stretches
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)  # Timestamp
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)  # Hostname
-        for i in range(2, 6):
-            header.setSectionResizeMode(i, QHeaderView.ResizeToContents)
+        for column, width in enumerate(TABLE_COLUMN_WIDTHS):
+            header.setSectionResizeMode(column, QHeaderView.Interactive)
+            header.resizeSection(column, width)
+        header.setSectionResizeMode(MESSAGE_COLUMN, QHeaderView.Stretch)  # Message column stretches
+        row_header = self.log_display.verticalHeader()
+        row_header.setSectionResizeMode(QHeaderView.Fixed)
+        row_header.setDefaultSectionSize(TABLE_ROW_HEIGHT)
+
+        # Auto-scroll state, only updated when the scrollbar moves
+        self._follow_tail = True
+        self.log_display.verticalScrollBar().valueChanged.connect(self._on_scroll)
 
         main_layout.addWidget(self.log_display)
 
+    @pyqtSlot(int)
+    def _on_scroll(self, value):
+        """Follow new logs while the user is near the bottom of the table."""
+        self._follow_tail = value >= self.log_display.verticalScrollBar().maximum() - FOLLOW_TAIL_MARGIN
+
     def _create_status_bar(self):
         """Create application status bar."""
         self.status_bar = QStatusBar(self)
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Ready.", 3000)
 
-    def setup_listener_thread(self):
-        """Initialize and start background syslog listener thread."""
-        self.listener_thread = QThread(self)
-        self.listener = SysLogListener()
-        self.listener.moveToThread(self.listener_thread)
+    def setup_listener_threads(self):
+        """Initialize and start the parser thread and background syslog listener threads (SO_REUSEPORT workers)."""
+        # Parser thread turns the listeners' raw datagrams into Syslog objects
+        self.parser_thread = QThread(self)
+        self.parser = SyslogParser()
+        self.parser.moveToThread(self.parser_thread)
+        self.parser_thread.started.connect(self.parser.run)
+        self.parser.logs_received.connect(self._handle_new_logs)
+        self.parser_thread.finished.connect(self.parser.deleteLater)
+        self.parser_thread.start()
+
+        for worker_id in range(LISTENER_WORKERS):
+            listener_thread = QThread(self)
+            listener = SysLogListener(self.parser, worker_id=worker_id, num_workers=LISTENER_WORKERS,
+                                      cpu_affinity=listener_cpu(worker_id))
+            listener.moveToThread(listener_thread)
+
+            # Connect thread and listener signals
+            listener_thread.started.connect(listener.run)
+            listener.status_update.connect(self.status_bar.showMessage)
+            listener_thread.finished.connect(listener.deleteLater)
+            listener_thread.finished.connect(lambda: self.status_bar.showMessage("Listener Thread Finished", 3000))
+
+            self.listener_threads.append(listener_thread)
+            self.listeners.append(listener)
+            listener_thread.start()
+
+        self.status_bar.showMessage(f"Listener Threads Started ({LISTENER_WORKERS})", 3000)
+
+    def setup_log_writer_thread(self):
+        """Initialize and start the thread that writes logs to the daily JSON files."""
+        self.log_writer_thread = QThread(self)
+        self.log_writer = LogWriter(self.log_directory)
+        self.log_writer.moveToThread(self.log_writer_thread)
+        self.log_writer_thread.started.connect(self.log_writer.run)
+        self.log_writer.write_error.connect(lambda message: self.status_bar.showMessage(message, 5000))
+        self.log_writer_thread.finished.connect(self.log_writer.deleteLater)
+        self.log_writer_thread.start()
+
+    @pyqtSlot(list)
+    def _handle_new_logs(self, syslog_objs):
+        """Queue a batch of syslog messages emitted by the parser thread for the next drain tick."""
+        self._pending_logs.extend(syslog_obj for syslog_obj in syslog_objs if self._handle_new_log(syslog_obj))
 
-        # Connect thread and listener signals
-        self.listener_thread.started.connect(self.listener.run)
-        self.listener.log_received.connect(self._handle_new_log)
-        self.listener.status_update.connect(self.status_bar.showMessage)
-        self.listener_thread.finished.connect(self.listener.deleteLater)
-        self.listener_thread.finished.connect(self.listener_thread.deleteLater)
-        self.listener_thread.finished.connect(lambda: self.status_bar.showMessage("Listener Thread Finished", 3000))
+    @pyqtSlot()
+    def _drain_pending_logs(self):
+        """Write and display all logs received since the last tick."""
+        if not self._pending_logs:
+            return
+        syslog_objs = self._pending_logs
+        self._pending_logs = []
+
+        # Hand to the writer thread if logging enabled (one write for everything received this tick)
+        if self.logging_enabled:
+            self.log_writer.submit(syslog_objs)
 
-        self.listener_thread.start()
-        self.status_bar.showMessage("Listener Thread Started", 3000)
+        # Add everything to the table in one insert, the filter proxy decides which rows are shown
+        self._add_logs_to_table(syslog_objs)
 
-    @pyqtSlot(object)
     def _handle_new_log(self, syslog_obj):
         """
-        Process incoming syslog messages from listener thread.
+        Validate an incoming syslog message from the parser thread.
 
-        Handles file logging, filter application, and UI updates.
+        Returns:
+            bool: True if it can be added to the table
         """
-        # Write to file if logging enabled
-        if self.logging_enabled:
-            self._write_log_to_file(syslog_obj)
-
-        # Validate syslog object
         if not isinstance(syslog_obj, Syslog):
-            print(f"Received non-Syslog object: {type(syslog_obj)}")
-            return
-
-        # Apply severity level filter
-        level_match = (self.current_monitor_level == -1 or
-                       (syslog_obj.log_monitor_level is not None and
-                        syslog_obj.log_monitor_level <= self.current_monitor_level))
+            log.warning("Received non-Syslog object: %s", type(syslog_obj))
+            return False
+        return True
 
-        if not level_match:
+    def _add_logs_to_table(self, syslog_objs):
+        """Append Syslog objects to the table model (cells are rendered on demand by the model)."""
+        if not syslog_objs:
             return
-
-        # Apply text filter
-        if self.current_filter.matches(syslog_obj):
-            if not syslog_obj.parsed:
-                print(f"Adding unparsed Syslog object that matched filters: {syslog_obj.to_string()}")
-                self._add_table_row(["", "", "", "", "", "", syslog_obj.to_string()], None)
-            else:
-                self._add_syslog_to_table(syslog_obj)
-
-    def _write_log_to_file(self, syslog_obj):
-        """Write syslog entry to daily JSON log file."""
         try:
-            # Ensure log directory exists
-            os.makedirs(self.log_directory, exist_ok=True)
-
-            # Generate daily filename
-            today_date = time.strftime('%Y-%m-%d')
-            filename = f"syslog_{today_date}.json.log"
-            filepath = os.path.join(self.log_directory, filename)
-
-            # Write JSON entry
-            log_dict = syslog_obj.to_dict()
-            with open(filepath, 'a', encoding='utf-8') as f:
-                json.dump(log_dict, f)
-                f.write('\n')
-
-        except IOError as e:
-            print(f"Error writing to log file {filepath}: {e}")
-            self.status_bar.showMessage(f"Log Write Error: {e}", 5000)
-        except Exception as e:
-            print(f"Unexpected error during log writing: {e}")
-            self.status_bar.showMessage(f"Log Write Error: {e}", 5000)
-
-    def _add_syslog_to_table(self, syslog_obj: Syslog):
-        """Convert Syslog object to table row data and add to display."""
-        row_data = [
-            syslog_obj.timestamp or "N/A",
-            syslog_obj.hostname or "N/A",
-            syslog_obj.severity_info[0] if syslog_obj.severity_info else "N/A",
-            syslog_obj.facility_info[0] if syslog_obj.facility_info else "N/A",
-            syslog_obj.process_name or "",
-            syslog_obj.pid or "",
-            syslog_obj.message or "N/A"
-        ]
-        self._add_table_row(row_data, syslog_obj)
-
-    def _add_table_row(self, row_data, syslog_obj=None):
-        """Add new row to log display table with proper formatting."""
-        try:
-            row_position = self.log_display.rowCount()
-            self.log_display.insertRow(row_position)
-
-            for col_index, data in enumerate(row_data):
-                item = QTableWidgetItem(str(data))
-                if col_index == 6 and syslog_obj and syslog_obj.message:
-                    item.setToolTip(str(syslog_obj.message))
-                self.log_display.setItem(row_position, col_index, item)
-                if col_index == 0 and syslog_obj:
-                    item.setData(Qt.UserRole, syslog_obj)
+            self.log_model.append_logs(syslog_objs)
 
             # Auto-scroll if user is near bottom
-            scrollbar = self.log_display.verticalScrollBar()
-            if scrollbar.value() >= scrollbar.maximum() - 15:
+            if self._follow_tail:
                 self.log_display.scrollToBottom()
 
         except Exception as e:
-            print(f"Error adding row to table: {e}")
+            log.error("Error adding row to table: %s", e)
             self.status_bar.showMessage(f"Error displaying log: {e}", 5000)
 
     @pyqtSlot(int)
@@ -323,12 +434,12 @@ class MainWindow(QMainWindow):
             self.settings.setValue(SETTINGS_MONITOR_LEVEL, self.current_monitor_level)
             level_text = self.level_combo.itemText(index)
             self.status_bar.showMessage(f"Monitor level set to: {level_text}", 3000)
-            print(f"Monitor level changed to: {self.current_monitor_level}")
+            log.info("Monitor level changed to: %s", self.current_monitor_level)
             self.apply_filter()
 
     @pyqtSlot()
     def apply_filter(self, is_initial=False):
-        """Parse text filter and apply both level and text filters to table rows."""
+        """Parse text filter and apply both level and text filters to the table (via the filter proxy)."""
         filter_text = self.filter_input.text()
 
         if not is_initial:
@@ -337,9 +448,10 @@ class MainWindow(QMainWindow):
             else:
                 self.status_bar.showMessage("Applying level filter...", 2000)
 
-        # Parse text filter
+        # Parse text filter (kept when the text didn't change, e.g. on level changes)
         try:
-            self.current_filter = LogFilter(filter_text)
+            if filter_text.strip() != self.current_filter.filter_string:
+                self.current_filter = LogFilter(filter_text)
             if self.current_filter.error:
                 self.status_bar.showMessage(f"Text Filter Error: {self.current_filter.error}", 5000)
                 return
@@ -348,40 +460,10 @@ class MainWindow(QMainWindow):
             self.current_filter = LogFilter()
             return
 
-        # Apply filters to all table rows
-        self.log_display.setUpdatesEnabled(False)
-        rows_shown = 0
-
-        for row in range(self.log_display.rowCount()):
-            should_be_visible = False
-            item = self.log_display.item(row, 0)
-            if not item:
-                continue
-
-            syslog_obj = item.data(Qt.UserRole)
-            if isinstance(syslog_obj, Syslog):
-                # Check level filter
-                level_match = (self.current_monitor_level == -1 or
-                               (syslog_obj.log_monitor_level is not None and
-                                syslog_obj.log_monitor_level <= self.current_monitor_level))
-
-                # Check text filter if level matches
-                if level_match:
-                    text_match = self.current_filter.matches(syslog_obj)
-                    if text_match:
-                        should_be_visible = True
-            else:
-                # Handle non-syslog rows (error messages)
-                if self.current_monitor_level == -1 and not self.current_filter.filter_string:
-                    should_be_visible = True
-
-            self.log_display.setRowHidden(row, not should_be_visible)
-            if should_be_visible:
-                rows_shown += 1
-
-        self.log_display.setUpdatesEnabled(True)
+        # Re-filter all rows through the proxy model
+        self.log_proxy.set_filter(self.current_monitor_level, self.current_filter)
         if not is_initial:
-            self.status_bar.showMessage(f"Filters applied. Showing {rows_shown} rows.", 3000)
+            self.status_bar.showMessage(f"Filters applied. Showing {self.log_proxy.rowCount()} rows.", 3000)
 
     @pyqtSlot()
     def reset_filter(self):
@@ -392,9 +474,15 @@ class MainWindow(QMainWindow):
     @pyqtSlot()
     def clear_table(self):
         """Remove all rows from log display table."""
-        self.log_display.setRowCount(0)
+        self.log_model.clear()
         self.status_bar.showMessage("Display cleared.", 3000)
-        print("Log display table cleared.")
+        log.info("Log display table cleared.")
+
+    @pyqtSlot()
+    def fit_columns(self):
+        """Resize the non-message columns to their contents once (message column keeps stretching)."""
+        for column in range(len(TABLE_COLUMN_WIDTHS)):
+            self.log_display.resizeColumnToContents(column)
 
     @pyqtSlot(bool)
     def _toggle_logging(self, checked):
@@ -403,10 +491,11 @@ class MainWindow(QMainWindow):
         self.settings.setValue(SETTINGS_LOG_ENABLED, self.logging_enabled)
         if checked:
             self.status_bar.showMessage(f"Logging enabled. Saving to: {self.log_directory}", 4000)
-            print(f"Logging enabled. Directory: {self.log_directory}")
+            log.info("Logging enabled. Directory: %s", self.log_directory)
         else:
+            self.log_writer.close_file()
             self.status_bar.showMessage("Logging disabled.", 4000)
-            print("Logging disabled.")
+            log.info("Logging disabled.")
 
     @pyqtSlot()
     def _set_log_directory(self):
@@ -418,38 +507,63 @@ class MainWindow(QMainWindow):
         )
         if new_dir and new_dir != self.log_directory:
             self.log_directory = new_dir
+            self.log_writer.set_log_directory(self.log_directory)
             self.settings.setValue(SETTINGS_LOG_DIR, self.log_directory)
             self.status_bar.showMessage(f"Log directory set to: {self.log_directory}", 4000)
-            print(f"Log directory set to: {self.log_directory}")
+            log.info("Log directory set to: %s", self.log_directory)
             if self.logging_enabled:
                 self.status_bar.showMessage(f"Logging enabled. Saving to: {self.log_directory}", 4000)
 
     def closeEvent(self, event):
-        """Handle application shutdown: stop listener thread and save settings."""
+        """Handle application shutdown: stop listener, parser and writer threads and save settings."""
         self.status_bar.showMessage("Closing application...")
-        print("Saving settings...")
+        log.info("Saving settings...")
 
         # Save all settings
         self.settings.setValue(SETTINGS_LOG_DIR, self.log_directory)
         self.settings.setValue(SETTINGS_LOG_ENABLED, self.logging_enabled)
         self.settings.setValue(SETTINGS_MONITOR_LEVEL, self.current_monitor_level)
-        self.settings.sync()
-
-        # Gracefully stop listener thread
-        if self.listener_thread and self.listener_thread.isRunning():
-            print("Stopping listener thread...")
-            if self.listener:
-                self.listener.stop()
-            if not self.listener_thread.wait(2000):
-                print("Warning: Listener thread did not finish gracefully. Terminating...")
-                self.listener_thread.terminate()
-                self.listener_thread.wait()
+        self.settings.setValue(SETTINGS_MAX_ROWS, self.max_display_rows)
+        self.settings.flush()
+
+        # Gracefully stop listener threads (quit() ends each thread's event loop once run() returns)
+        for listener, listener_thread in zip(self.listeners, self.listener_threads):
+            listener.stop()
+            listener_thread.quit()
+        for listener_thread in self.listener_threads:
+            if not listener_thread.isRunning():
+                continue
+            log.info("Stopping listener thread...")
+            if not listener_thread.wait(2000):
+                log.warning("Listener thread did not finish gracefully. Terminating...")
+                listener_thread.terminate()
+                listener_thread.wait()
             else:
-                print("Listener thread stopped successfully.")
-        else:
-            print("Listener thread not running or already stopped.")
-
-        print("Exiting application.")
+                log.info("Listener thread stopped successfully.")
+
+        # Stop the parser once nothing else is queued by the listeners
+        self.parser.stop()
+        self.parser_thread.quit()
+        if self.parser_thread.isRunning() and not self.parser_thread.wait(2000):
+            log.warning("Parser thread did not finish gracefully. Terminating...")
+            self.parser_thread.terminate()
+            self.parser_thread.wait()
+
+        # Deliver the parser's last batches (queued signals not yet handled by the event loop),
+        # then save/display everything received since the last drain tick
+        QCoreApplication.sendPostedEvents(self)
+        self._drain_timer.stop()
+        self._drain_pending_logs()
+
+        # Stop the writer once everything is queued, it writes the rest and closes the file
+        self.log_writer.stop()
+        self.log_writer_thread.quit()
+        if self.log_writer_thread.isRunning() and not self.log_writer_thread.wait(5000):
+            log.warning("Log writer thread did not finish gracefully. Terminating...")
+            self.log_writer_thread.terminate()
+            self.log_writer_thread.wait()
+
+        log.info("Exiting application.")
         event.accept()
 
 
@@ -458,12 +572,18 @@ if __name__ == "__main__":
     app.setOrganizationName("SJust")
     app.setApplicationName("SIEM Log Monitor")
 
+    # Diagnostics logging, SIEM_DEBUG=1 enables per-packet details
+    diagnostic_listener = setup_diagnostic_logging(
+        logging.DEBUG if os.environ.get("SIEM_DEBUG") == "1" else logging.INFO)
+
     # Apply dark theme if available
     try:
-        app.setStyleSheet(theme.DARK_STYLE)
+        app.setStyleSheet(theme.DARK_STYLE_MIN)
     except Exception as e:
-        print(f"Warning: Could not load theme.DARK_STYLE: {e}. Using default style.")
+        log.warning("Could not load theme.DARK_STYLE_MIN: %s. Using default style.", e)
 
     main_window = MainWindow()
     main_window.show()
-    sys.exit(app.exec_())
\ No newline at end of file
+    exit_code = app.exec_()
+    diagnostic_listener.stop()  # Write out queued diagnostics before exiting
+    sys.exit(exit_code)
\ No newline at end of file
@@ -0,0 +1,132 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+#syslog_parse.pyx
+#
+# Optional compiled RFC 3164 header parser used by siem_core.Syslog.parse_data.
+# Walks the decoded string once and returns the same six fields as SYSLOG_PATTERN's groups().
+# Build in place with: cythonize -i syslog_parse.pyx   (pip install cython)
+# Without the compiled module siem_core falls back to the regex.
+
+
+def parse_rfc3164(str text):
+    """
+    Parse a decoded syslog line with the same rules as siem_core.SYSLOG_PATTERN.match().
+
+    Args:
+        text (str): Decoded syslog message
+
+    Returns:
+        tuple: (priority, timestamp, hostname, process_name, pid, message) like match.groups(),
+               pid is None when absent. None if the line doesn't match.
+    """
+    cdef Py_ssize_t n = len(text)
+    cdef Py_ssize_t i, start, ts_start, host_start, host_end, proc_start, proc_end, pid_start, pid_end
+    cdef Py_UCS4 c
+    cdef int count
+
+    # === <priority> ===
+    if n < 3 or text[0] != u'<':
+        return None
+    i = 1
+    while i < n and text[i].isdecimal():
+        i += 1
+    if i == 1 or i >= n or text[i] != u'>':
+        return None
+    start = i + 1
+
+    # === Timestamp: 3 letters, whitespace, 1-2 digits, whitespace, hh:mm:ss ===
+    ts_start = start
+    i = start
+    for count in range(3):
+        if i >= n:
+            return None
+        c = text[i]
+        if not ((u'A' <= c <= u'Z') or (u'a' <= c <= u'z')):
+            return None
+        i += 1
+    count = 0
+    while i < n and text[i].isspace():
+        i += 1
+        count += 1
+    if count == 0:
+        return None
+    count = 0
+    while i < n and count < 2 and text[i].isdecimal():
+        i += 1
+        count += 1
+    if count == 0:
+        return None
+    count = 0
+    while i < n and text[i].isspace():
+        i += 1
+        count += 1
+    if count == 0:
+        return None
+    for count in range(8):
+        if i >= n:
+            return None
+        c = text[i]
+        if count == 2 or count == 5:
+            if c != u':':
+                return None
+        elif not c.isdecimal():
+            return None
+        i += 1
+    timestamp = text[ts_start:i]
+
+    # === Hostname: whitespace, then non-whitespace run ===
+    start = i
+    while i < n and text[i].isspace():
+        i += 1
+    if i == start:
+        return None
+    host_start = i
+    while i < n and not text[i].isspace():
+        i += 1
+    if i == host_start:
+        return None
+    host_end = i
+
+    # === Process name: whitespace, then run without '[', ':' or whitespace ===
+    start = i
+    while i < n and text[i].isspace():
+        i += 1
+    if i == start:
+        return None
+    proc_start = i
+    while i < n:
+        c = text[i]
+        if c == u'[' or c == u':' or c.isspace():
+            break
+        i += 1
+    if i == proc_start:
+        return None
+    proc_end = i
+
+    # === Optional [pid] ===
+    pid = None
+    if i < n and text[i] == u'[':
+        pid_start = i + 1
+        pid_end = pid_start
+        while pid_end < n and text[pid_end].isdecimal():
+            pid_end += 1
+        if pid_end == pid_start or pid_end >= n or text[pid_end] != u']':
+            return None  # '[' can't start the separator either, so the line doesn't match
+        pid = text[pid_start:pid_end]
+        i = pid_end + 1
+
+    # === Optional ':' then whitespace ===
+    if i < n and text[i] == u':':
+        i += 1
+    start = i
+    while i < n and text[i].isspace():
+        i += 1
+    if i == start:
+        return None
+
+    # === Message: rest of the line ('.' stops at a newline) ===
+    start = i
+    while i < n and text[i] != u'\n':
+        i += 1
+
+    return (text[1:ts_start - 1], timestamp, text[host_start:host_end],
+            text[proc_start:proc_end], pid, text[start:i])
@@ -1,5 +1,7 @@
 # theme.py
 
+import re
+
 DARK_STYLE = """
 QMainWindow {
     background-color: #2e2e2e;
@@ -98,7 +100,7 @@ QPushButton:pressed {
     background-color: #4a4a4a;
 }
 
-QTableWidget {
+QTableView {
     background-color: #3c3c3c;
     color: #f0f0f0;
     gridline-color: #555555;
@@ -128,4 +130,6 @@ QStatusBar {
 QStatusBar::item {
     border: none;
 }
-"""
\ No newline at end of file
+"""
+# Same stylesheet without comments and repeated whitespace (smaller input for Qt's stylesheet parser)
+DARK_STYLE_MIN = re.sub(r"\s+", " ", re.sub(r"/\*.*?\*/", "", DARK_STYLE, flags=re.S)).strip()